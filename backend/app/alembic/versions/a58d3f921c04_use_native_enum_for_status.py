@@ -0,0 +1,41 @@
+"""Use native enum for status
+
+Revision ID: a58d3f921c04
+Revises: c91b06d54a37
+Create Date: 2026-08-29 10:47:52.318466
+
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision = 'a58d3f921c04'
+down_revision = 'c91b06d54a37'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    status_enum = postgresql.ENUM(
+        'active', 'inactive', 'deleted', name='status_enum'
+    )
+    status_enum.create(op.get_bind(), checkfirst=True)
+    # city is not tracked by earlier migrations, so only convert it when present
+    if sa.inspect(op.get_bind()).has_table('city'):
+        op.execute(
+            'ALTER TABLE city ALTER COLUMN status_id DROP DEFAULT, '
+            'ALTER COLUMN status_id TYPE status_enum USING status_id::status_enum, '
+            "ALTER COLUMN status_id SET DEFAULT 'active'"
+        )
+
+
+def downgrade():
+    if sa.inspect(op.get_bind()).has_table('city'):
+        op.execute(
+            'ALTER TABLE city ALTER COLUMN status_id DROP DEFAULT, '
+            'ALTER COLUMN status_id TYPE varchar USING status_id::varchar, '
+            "ALTER COLUMN status_id SET DEFAULT 'active'"
+        )
+    postgresql.ENUM(name='status_enum').drop(op.get_bind(), checkfirst=True)
@@ -0,0 +1,29 @@
+"""Index item.owner_id and city.region_id
+
+Revision ID: c91b06d54a37
+Revises: f42e87c15b2d
+Create Date: 2026-08-29 10:31:18.664207
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'c91b06d54a37'
+down_revision = 'f42e87c15b2d'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_index(op.f('ix_item_owner_id'), 'item', ['owner_id'], unique=False)
+    # city is not tracked by earlier migrations, so only index it when present
+    if sa.inspect(op.get_bind()).has_table('city'):
+        op.create_index(op.f('ix_city_region_id'), 'city', ['region_id'], unique=False)
+
+
+def downgrade():
+    if sa.inspect(op.get_bind()).has_table('city'):
+        op.drop_index(op.f('ix_city_region_id'), table_name='city')
+    op.drop_index(op.f('ix_item_owner_id'), table_name='item')
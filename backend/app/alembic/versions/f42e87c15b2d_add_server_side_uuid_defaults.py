@@ -0,0 +1,27 @@
+"""Add server side uuid defaults
+
+Revision ID: f42e87c15b2d
+Revises: 1a31ce608336
+Create Date: 2026-08-29 10:12:45.102934
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'f42e87c15b2d'
+down_revision = '1a31ce608336'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.execute("CREATE EXTENSION IF NOT EXISTS pgcrypto")
+    op.alter_column('user', 'id', server_default=sa.text('gen_random_uuid()'))
+    op.alter_column('item', 'id', server_default=sa.text('gen_random_uuid()'))
+
+
+def downgrade():
+    op.alter_column('item', 'id', server_default=None)
+    op.alter_column('user', 'id', server_default=None)
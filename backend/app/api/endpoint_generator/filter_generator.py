@@ -1,10 +1,70 @@
-from typing import Optional, Any, Dict, Callable
+from collections.abc import Callable
+from dataclasses import dataclass
+from datetime import datetime
+from functools import cache
+from inspect import Parameter, Signature
+from typing import Any, Optional
+
 from fastapi import Query
 from sqlalchemy import inspect
-from sqlalchemy.sql.sqltypes import String, Integer, DateTime, Boolean, Float
+from sqlalchemy.sql.sqltypes import Boolean, DateTime, Float, Integer, String
 from sqlmodel.sql.sqltypes import AutoString
 
-from datetime import datetime
+# Соответствие SQLAlchemy-типов python-типам (один раз на модуль)
+_TYPE_MAPPING = (
+    (String, str),
+    (AutoString, str),  # SQLModel AutoString
+    (Integer, int),
+    (Float, float),
+    (DateTime, datetime),
+    (Boolean, bool),
+)
+
+
+@cache
+def _inspect_columns(model_class, exclude_fields_tuple: tuple) -> tuple:
+    """Инспектирует колонки модели один раз на пару (модель, исключённые поля)"""
+    inspector = inspect(model_class)
+    return tuple(
+        (column.name, column.type)
+        for column in inspector.columns
+        if column.name not in exclude_fields_tuple
+    )
+
+
+@dataclass(frozen=True)
+class FilterSpec:
+    """Описание одного параметра фильтрации"""
+
+    param_name: str
+    alias: str
+    description: str
+    annotation: Any
+    fastcrud_key: str
+    coerce: Callable[[Any], Any]
+
+
+def _coerce_identity(value):
+    return value
+
+
+def _coerce_like(value):
+    return f"%{value}%" if value else None
+
+
+def _coerce_in_str(value):
+    if not value:
+        return None
+    return [x.strip() for x in value.split(",")]
+
+
+def _coerce_in_int(value):
+    if not value:
+        return None
+    try:
+        return [int(x.strip()) for x in value.split(",")]
+    except ValueError:
+        return None  # Игнорируем невалидные значения
 
 
 class FilterGenerator:
@@ -55,32 +115,30 @@ class FilterGenerator:
         "in": "__in",  # field IN (values)
     }
 
+    # Кэш: класс SQLAlchemy-типа -> операторы (вместо linear isinstance-скана)
+    _OPERATOR_CACHE: dict[type, list[str]] = {}
+
     def __init__(self, model_class, exclude_fields: list = []):
         self.model_class = model_class
         self.exclude_fields = exclude_fields or []
         self.model_fields = self._get_model_fields()
-
-    def _get_model_fields(self) -> Dict[str, Any]:
-        inspector = inspect(self.model_class)
-        fields = {}
-
-        for column in inspector.columns:
-            if column.name not in self.exclude_fields:
-                fields[column.name] = column.type
-        return fields
+        # Определяем python-тип и операторы один раз на поле
+        self._field_specs = [
+            (name, self._get_python_type(t), self._get_operators_for_type(t))
+            for name, t in self.model_fields.items()
+        ]
+        self._specs = self._build_spec()
+        # Предвычисленный индекс: имя параметра -> spec
+        self._param_specs = {spec.param_name: spec for spec in self._specs}
+
+    def _get_model_fields(self) -> dict[str, Any]:
+        return dict(
+            _inspect_columns(self.model_class, tuple(self.exclude_fields))
+        )
 
     def _get_python_type(self, sqlalchemy_type) -> str | int | float | bool | datetime:
         """Преобразует SQLAlchemy тип в Python тип"""
-        type_mapping = {
-            String: str,
-            AutoString: str,  
-            Integer: int,
-            Float: float,
-            DateTime: datetime,  
-            Boolean: bool,
-        }
-
-        for sql_type, python_type in type_mapping.items():
+        for sql_type, python_type in _TYPE_MAPPING:
             if isinstance(sqlalchemy_type, sql_type):
                 return python_type
 
@@ -88,80 +146,87 @@ class FilterGenerator:
 
     def _get_operators_for_type(self, sqlalchemy_type) -> list[str]:
         """Получить доступные операторы для типа поля"""
-        for sql_type, operators in self.TYPE_OPERATORS.items():
-            if isinstance(sqlalchemy_type, sql_type):
-                return operators
+        type_cls = type(sqlalchemy_type)
+        cached = self._OPERATOR_CACHE.get(type_cls)
+        if cached is not None:
+            return cached
 
-        return ["eq"] 
-
-    def generate_filter_function(self) -> Callable:
-
-        function_params = []
-
-        for field_name, field_type in self.model_fields.items():
-            python_type = self._get_python_type(field_type)
-            operators = self._get_operators_for_type(field_type)
-
-            for operator in operators:
-                param_name = f"filter_{field_name}_{operator}"
-                alias = f"filter[{field_name}][{operator}]"
-                description = f"{field_name} - {self.OPERATOR_DESCRIPTIONS.get(operator, operator)}"
-
-                if operator == "in" or operator == "not_in":
-                    function_params.append(
-                        f"{param_name}: Optional[str] = Query(None, alias='{alias}', description='{description}')"
-                    )
-                else:
-                    type_hint = "str" if python_type == str else python_type.__name__  # type: ignore
-                    function_params.append(
-                        f"{param_name}: Optional[{type_hint}] = Query(None, alias='{alias}', description='{description}')"
-                    )
-        function_def = (
-            "def generated_filter_function(\n    "
-            + ",\n    ".join(function_params)
-            + "\n):\n"
-        )
+        operators = ["eq"]
+        for sql_type, type_operators in self.TYPE_OPERATORS.items():
+            if isinstance(sqlalchemy_type, sql_type):
+                operators = type_operators
+                break
 
-        function_def += "    filters = {}\n"
+        self._OPERATOR_CACHE[type_cls] = operators
+        return operators
 
-        for field_name, field_type in self.model_fields.items():
-            operators = self._get_operators_for_type(field_type)
+    def _build_spec(self) -> list[FilterSpec]:
+        """Строит таблицу параметров фильтрации вместо кодогенерации"""
+        specs: list[FilterSpec] = []
 
+        for field_name, python_type, operators in self._field_specs:
             for operator in operators:
-                param_name = f"filter_{field_name}_{operator}"
-                fastcrud_key = field_name + self.OPERATOR_MAPPING[operator]
-
                 if operator == "like":
-                    function_def += f"    if {param_name}:\n"
-                    function_def += (
-                        f"        filters['{fastcrud_key}'] = f'%{{{param_name}}}%'\n"
-                    )
+                    annotation = str
+                    coerce = _coerce_like
                 elif operator == "in" or operator == "not_in":
-                    function_def += f"    if {param_name}:\n"
-                    function_def += f"        try:\n"
-                    if self._get_python_type(field_type) == int:
-                        function_def += f"            filters['{fastcrud_key}'] = [int(x.strip()) for x in {param_name}.split(',')]\n"
-                    else:
-                        function_def += f"            filters['{fastcrud_key}'] = [x.strip() for x in {param_name}.split(',')]\n"
-                    function_def += f"        except ValueError:\n"
-                    function_def += (
-                        f"            pass  # Игнорируем невалидные значения\n"
-                    )
+                    annotation = str
+                    coerce = _coerce_in_int if python_type == int else _coerce_in_str
                 else:
-                    function_def += f"    if {param_name} is not None:\n"
-                    function_def += (
-                        f"        filters['{fastcrud_key}'] = {param_name}\n"
+                    annotation = python_type
+                    coerce = _coerce_identity
+
+                specs.append(
+                    FilterSpec(
+                        param_name=f"filter_{field_name}_{operator}",
+                        alias=f"filter[{field_name}][{operator}]",
+                        description=f"{field_name} - {self.OPERATOR_DESCRIPTIONS.get(operator, operator)}",
+                        annotation=annotation,
+                        fastcrud_key=field_name + self.OPERATOR_MAPPING[operator],
+                        coerce=coerce,
                     )
+                )
+
+        return specs
 
-        function_def += "    return filters\n"
+    def generate_filter_function(self) -> Callable:
+        specs = self._specs
+        param_specs = self._param_specs
+
+        def generated_filter_function(**values):
+            filters = {}
+            for name, value in values.items():
+                if value is None:
+                    continue
+                spec = param_specs[name]
+                coerced = spec.coerce(value)
+                if coerced is not None:
+                    filters[spec.fastcrud_key] = coerced
+            return filters
+
+        # Явная сигнатура, чтобы FastAPI зарегистрировал query-параметры в OpenAPI
+        generated_filter_function.__signature__ = Signature(
+            [
+                Parameter(
+                    spec.param_name,
+                    Parameter.KEYWORD_ONLY,
+                    default=Query(None, alias=spec.alias, description=spec.description),
+                    annotation=Optional[spec.annotation],
+                )
+                for spec in specs
+            ]
+        )
 
-        local_vars = {"Optional": Optional, "Query": Query, "datetime": datetime}
-        exec(function_def, local_vars)
+        return generated_filter_function
 
-        return local_vars["generated_filter_function"]
+
+@cache
+def _build_filter_fn(model_class, exclude_fields_tuple: tuple) -> Callable:
+    """Строит функцию фильтрации один раз на пару (модель, исключённые поля)"""
+    generator = FilterGenerator(model_class, list(exclude_fields_tuple))
+    return generator.generate_filter_function()
 
 
 def create_filter_dependency(model_class, exclude_fields: list = []) -> Callable:
 
-    generator = FilterGenerator(model_class, exclude_fields)
-    return generator.generate_filter_function()
+    return _build_filter_fn(model_class, tuple(exclude_fields))
@@ -1,5 +1,6 @@
 from sqlmodel import SQLModel, Session, select
 from enum import Enum
+from functools import cached_property
 from typing import Callable, Annotated
 from pydantic import BaseModel
 from fastapi import params, APIRouter, Depends, HTTPException
@@ -32,21 +33,14 @@ class EndpointGenerator:
         model_update: SQLModel,
         model_public: SQLModel,
         model_public_with_pagination: BaseModel,
-        included_actions: list[str] = [
-            GeneralAction.VIEW,
-            GeneralAction.LIST,
-            GeneralAction.CREATE,
-            GeneralAction.UPDATE,
-            GeneralAction.DELETE,
-            GeneralAction.RESTORE,
-        ],
+        included_actions: list[str] | None = None,
         dependencies_view: list[params.Depends] | None = None,
         dependencies_list: list[params.Depends] | None = None,
         dependencies_create: list[params.Depends] | None = None,
         dependencies_update: list[params.Depends] | None = None,
         dependencies_delete: list[params.Depends] | None = None,
         dependencies_restore: list[params.Depends] | None = None,
-        deleted_actions: list[str] = [],
+        deleted_actions: list[str] | None = None,
     ) -> None:
         endpoint_name = model_db.__name__.lower()
         self.session = session
@@ -57,8 +51,19 @@ class EndpointGenerator:
         self.model_update = model_update
         self.model_public = model_public
         self.model_public_with_pagination = model_public_with_pagination
-        self.included_actions = included_actions
-        self.deleted_actions = deleted_actions
+        self.included_actions = frozenset(
+            included_actions
+            if included_actions is not None
+            else (
+                GeneralAction.VIEW,
+                GeneralAction.LIST,
+                GeneralAction.CREATE,
+                GeneralAction.UPDATE,
+                GeneralAction.DELETE,
+                GeneralAction.RESTORE,
+            )
+        )
+        self.deleted_actions = frozenset(deleted_actions) if deleted_actions else frozenset()
         self.dependencies_view = dependencies_view
         self.dependencies_list = dependencies_list
         self.dependencies_create = dependencies_create
@@ -66,7 +71,27 @@ class EndpointGenerator:
         self.dependencies_delete = dependencies_delete
         self.dependencies_restore = dependencies_restore
         self.router = router if router else APIRouter(prefix=self.path, tags=self.tags)
+        self._filter_dependency = create_filter_dependency(model_db, exclude_fields)
+        self._enabled = self.included_actions - self.deleted_actions
+        name = model_db.__name__
+        self._op_ids = {
+            GeneralAction.VIEW: f"1_get_one_{name}",
+            GeneralAction.LIST: f"2_get_list_{name}",
+            GeneralAction.CREATE: f"3_create_one_{name}",
+            GeneralAction.UPDATE: f"4_update_one_{name}",
+            GeneralAction.DELETE: f"5_delete_one_{name}",
+            GeneralAction.RESTORE: f"6_restore_one_{name}",
+        }
+        self._descriptions = {
+            GeneralAction.VIEW: f"Read a single {name} row from the database by its primary key.",
+            GeneralAction.LIST: f"Read multiple {name} rows from the database.",
+            GeneralAction.CREATE: f"Create a {name} row in the database.",
+            GeneralAction.UPDATE: f"Update a {name} row in the database.",
+            GeneralAction.DELETE: f"Delete a {name} row in the database.",
+            GeneralAction.RESTORE: f"Rstore a {name} row in the database.",
+        }
 
+    @cached_property
     def _get_one_endpoint(self):
         def _get_one(
             session: Annotated[Session, Depends(self.session)],
@@ -80,15 +105,14 @@ class EndpointGenerator:
 
         return _get_one
 
+    @cached_property
     def _get_list_endpoint(self):
         def _get_list(
             *,
             session: Annotated[Session, Depends(self.session)],
             current_user: CurrentUser,
             query_params: Annotated[CommonQueryParams, Depends()],
-            filters: dict = Depends(
-                create_filter_dependency(self.model_db, exclude_fields)
-            ),
+            filters: dict = Depends(self._filter_dependency),
         ):
             statement = select(self.model_db)  # type: ignore
             statement = set_status(
@@ -96,13 +120,13 @@ class EndpointGenerator:
                 model_db=self.model_db,  # type: ignore
                 status=query_params.status,
             )
-            statement = set_filters(
+            filtered = set_filters(
                 statement=statement,
                 model_db=self.model_db,  # type: ignore
                 filters=filters,
             )
             statement = set_sorting(
-                statement=statement,
+                statement=filtered.statement,
                 model_db=self.model_db,  # type: ignore
                 sort=query_params.sort,
             )
@@ -111,10 +135,13 @@ class EndpointGenerator:
                 pagination=query_params.pagination,
                 model_db=self.model_db,  # type: ignore
                 statement=statement,
+                has_user_filters=filtered.has_user_filters,
+                status=query_params.status,
             )
 
         return _get_list
 
+    @cached_property
     def _create_one_endpoint(self):
         def _create_one(
             session: Annotated[Session, Depends(self.session)],
@@ -136,6 +163,7 @@ class EndpointGenerator:
 
         return _create_one
 
+    @cached_property
     def _update_one_endpoint(self):
         def _update_one(
             session: Annotated[Session, Depends(self.session)],
@@ -162,6 +190,7 @@ class EndpointGenerator:
 
         return _update_one
 
+    @cached_property
     def _delete_one_endpoint(self):
         def _delete_one(
             session: Annotated[Session, Depends(self.session)],
@@ -183,6 +212,7 @@ class EndpointGenerator:
 
         return _delete_one
 
+    @cached_property
     def _restore_one_endpoint(self):
         def _restore_one(
             session: Annotated[Session, Depends(self.session)],
@@ -215,83 +245,69 @@ class EndpointGenerator:
             return ""
 
     def get_router(self):
+        # (действие, endpoint, методы, путь, зависимости, response_model)
+        action_table = [
+            (
+                GeneralAction.VIEW,
+                self._get_one_endpoint,
+                ["GET"],
+                self.get_path(is_id_in_path=True),
+                self.dependencies_view,
+                self.model_public,
+            ),
+            (
+                GeneralAction.LIST,
+                self._get_list_endpoint,
+                ["GET"],
+                self.get_path(is_id_in_path=False),
+                self.dependencies_list,
+                self.model_public_with_pagination,
+            ),
+            (
+                GeneralAction.CREATE,
+                self._create_one_endpoint,
+                ["POST"],
+                self.get_path(is_id_in_path=False),
+                self.dependencies_create,
+                self.model_public,
+            ),
+            (
+                GeneralAction.UPDATE,
+                self._update_one_endpoint,
+                ["PATCH"],
+                self.get_path(is_id_in_path=True),
+                self.dependencies_update,
+                self.model_public,
+            ),
+            (
+                GeneralAction.DELETE,
+                self._delete_one_endpoint,
+                ["DELETE"],
+                self.get_path(is_id_in_path=True),
+                self.dependencies_delete,
+                self.model_public,
+            ),
+            (
+                GeneralAction.RESTORE,
+                self._restore_one_endpoint,
+                ["PATCH"],
+                self.get_path(is_id_in_path=True, is_restore=True),
+                self.dependencies_restore,
+                self.model_public,
+            ),
+        ]
 
-        if (GeneralAction.VIEW in self.included_actions) and (
-            GeneralAction.VIEW not in self.deleted_actions
-        ):
-            self.router.add_api_route(
-                path=self.get_path(is_id_in_path=True),
-                endpoint=self._get_one_endpoint(),
-                methods=["GET"],
-                tags=self.tags,
-                dependencies=self.dependencies_view,
-                response_model=self.model_public,
-                operation_id=f"1_get_one_{self.model_db.__name__}",
-                description=f"Read a single {self.model_db.__name__} row from the database by its primary key.",
-            )
-        if (GeneralAction.LIST in self.included_actions) and (
-            GeneralAction.LIST not in self.deleted_actions
-        ):
-            self.router.add_api_route(
-                path=self.get_path(is_id_in_path=False),
-                endpoint=self._get_list_endpoint(),
-                methods=["GET"],
-                tags=self.tags,
-                dependencies=self.dependencies_list,
-                response_model=self.model_public_with_pagination,
-                operation_id=f"2_get_list_{self.model_db.__name__}",
-                description=f"Read multiple {self.model_db.__name__} rows from the database.",
-            )
-        if (GeneralAction.CREATE in self.included_actions) and (
-            GeneralAction.CREATE not in self.deleted_actions
-        ):
-            self.router.add_api_route(
-                path=self.get_path(is_id_in_path=False),
-                endpoint=self._create_one_endpoint(),
-                methods=["POST"],
-                tags=self.tags,
-                dependencies=self.dependencies_create,
-                response_model=self.model_public,
-                operation_id=f"3_create_one_{self.model_db.__name__}",
-                description=f"Create a {self.model_db.__name__} row in the database.",
-            )
-        if (GeneralAction.UPDATE in self.included_actions) and (
-            GeneralAction.UPDATE not in self.deleted_actions
-        ):
-            self.router.add_api_route(
-                path=self.get_path(is_id_in_path=True),
-                endpoint=self._update_one_endpoint(),
-                methods=["PATCH"],
-                tags=self.tags,
-                dependencies=self.dependencies_update,
-                response_model=self.model_public,
-                operation_id=f"4_update_one_{self.model_db.__name__}",
-                description=f"Update a {self.model_db.__name__} row in the database.",
-            )
-        if (GeneralAction.DELETE in self.included_actions) and (
-            GeneralAction.DELETE not in self.deleted_actions
-        ):
-            self.router.add_api_route(
-                path=self.get_path(is_id_in_path=True),
-                endpoint=self._delete_one_endpoint(),
-                methods=["DELETE"],
-                tags=self.tags,
-                dependencies=self.dependencies_delete,
-                response_model=self.model_public,
-                operation_id=f"5_delete_one_{self.model_db.__name__}",
-                description=f"Delete a {self.model_db.__name__} row in the database.",
-            )
-        if (GeneralAction.RESTORE in self.included_actions) and (
-            GeneralAction.RESTORE not in self.deleted_actions
-        ):
+        for action, endpoint, methods, path, dependencies, response_model in action_table:
+            if action not in self._enabled:
+                continue
             self.router.add_api_route(
-                path=self.get_path(is_id_in_path=True, is_restore=True),
-                endpoint=self._restore_one_endpoint(),
-                methods=["PATCH"],
+                path=path,
+                endpoint=endpoint,
+                methods=methods,
                 tags=self.tags,
-                dependencies=self.dependencies_restore,
-                response_model=self.model_public,
-                operation_id=f"6_restore_one_{self.model_db.__name__}",
-                description=f"Rstore a {self.model_db.__name__} row in the database.",
+                dependencies=dependencies,
+                response_model=response_model,
+                operation_id=self._op_ids[action],
+                description=self._descriptions[action],
             )
         return self.router
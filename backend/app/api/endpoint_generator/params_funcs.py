@@ -1,8 +1,13 @@
+import time
+
 from sqlmodel.sql.expression import SelectOfScalar
 from sqlmodel import SQLModel, select, func, Session, asc, desc
 from sqlalchemy import inspect
 from fastapi import HTTPException
+from dataclasses import dataclass
+from functools import lru_cache
 from typing import Any
+from weakref import WeakKeyDictionary
 
 from app.models import Status, SuperBase
 from app.api.endpoint_generator.api_models import (
@@ -13,6 +18,24 @@ from app.api.endpoint_generator.api_models import (
 from sqlalchemy.exc import ArgumentError
 
 
+# Кэш {модель: {имя колонки: InstrumentedAttribute}}, чтобы не резолвить
+# дескрипторы через getattr на каждый фильтр/сортировку
+_COL_CACHE: WeakKeyDictionary = WeakKeyDictionary()
+
+
+def _col(model_db: type, name: str) -> Any:
+    try:
+        columns = _COL_CACHE[model_db]
+    except KeyError:
+        columns = _COL_CACHE.setdefault(model_db, {})
+    try:
+        return columns[name]
+    except KeyError:
+        column = getattr(model_db, name, None)
+        columns[name] = column
+        return column
+
+
 def set_status(statement: SelectOfScalar, model_db: SuperBase, status: Status):
     return statement.where(model_db.status_id == status)
 
@@ -32,6 +55,7 @@ def get_model_fields(model_db: SQLModel, exclude_fields: list[str] = []) -> list
     return fields
 
 
+@lru_cache(maxsize=256)
 def parse_sort_string(sort_string: str) -> tuple[list[str], list[str]]:
     """
     Парсит строку сортировки в массивы полей и направлений
@@ -51,25 +75,18 @@ def parse_sort_string(sort_string: str) -> tuple[list[str], list[str]]:
     if not sort_string or not sort_string.strip():
         return [], []
 
-    sort_columns = []
-    sort_orders = []
+    # Один проход: разбиваем по запятой, минус в начале поля означает DESC
+    parts = [
+        (field[1:].strip(), "desc") if field.startswith("-") else (field, "asc")
+        for field in map(str.strip, sort_string.split(","))
+        if field and field.lstrip("-").strip()
+    ]
 
-    # Разбиваем по запятой и обрабатываем каждое поле
-    fields = [field.strip() for field in sort_string.split(",") if field.strip()]
-
-    for field in fields:
-        if field.startswith("-"):
-            # Убираем минус и добавляем DESC
-            column_name = field[1:].strip()
-            if column_name:  # Проверяем что после минуса есть название поля
-                sort_columns.append(column_name)
-                sort_orders.append("desc")
-        else:
-            # Обычное поле - ASC
-            sort_columns.append(field)
-            sort_orders.append("asc")
+    if not parts:
+        return [], []
 
-    return sort_columns, sort_orders
+    sort_columns, sort_orders = zip(*parts, strict=True)
+    return list(sort_columns), list(sort_orders)
 
 
 def apply_sorting(
@@ -78,6 +95,8 @@ def apply_sorting(
     sort_columns: str | list[str],
     sort_orders: str | list[str] | None = None,
 ) -> SelectOfScalar:
+    if not sort_columns and not sort_orders:
+        return statement
     if sort_orders and not sort_columns:
         raise ValueError("Sort orders provided without corresponding sort columns.")
 
@@ -103,78 +122,79 @@ def apply_sorting(
             ["asc"] * len(sort_columns) if not sort_orders else sort_orders
         )
 
+        orderings = []
         for idx, column_name in enumerate(sort_columns):
-            column = getattr(model_db, column_name, None)
-            if not column:
+            column = _col(model_db, column_name)
+            if column is None:
                 raise ArgumentError(f"Invalid column name: {column_name}")
 
             order = validated_sort_orders[idx]
-            statement = statement.order_by(asc(column) if order == "asc" else desc(column))
+            orderings.append(asc(column) if order == "asc" else desc(column))
+
+        statement = statement.order_by(*orderings)
 
     return statement
 
 
+# Оператор -> построение условия (вместо цепочки if/elif на каждый фильтр)
+_OP_DISPATCH = {
+    SQLOperators.eq: lambda column, value: column == value,
+    SQLOperators.ilike: lambda column, value: column.ilike(value),
+    SQLOperators._in: lambda column, value: column.in_(value),
+    SQLOperators.gte: lambda column, value: column >= value,
+    SQLOperators.lte: lambda column, value: column <= value,
+    SQLOperators.gt: lambda column, value: column > value,
+    SQLOperators.lt: lambda column, value: column < value,
+}
+
+
+@dataclass
+class FilteredStatement:
+    """Statement вместе с признаком, применялись ли пользовательские фильтры"""
+
+    statement: SelectOfScalar
+    has_user_filters: bool
+
+
 def set_filters(
     statement: SelectOfScalar, model_db: SuperBase, filters: dict[str, Any]
-):
+) -> FilteredStatement:
     if not filters:
-        return statement
-    new_dict = {}
-    for k, v in filters.items():
-        if k.startswith("created_at"):
-            new_dict[k] = v.isoformat()
-        else:
-            new_dict[k] = v
+        return FilteredStatement(statement=statement, has_user_filters=False)
 
+    conditions = []
     for k, v in filters.items():
-        begin = ""
-        end = SQLOperators.eq
-        elems = k.split("__")
+        elems = k.split("__", 1)
         begin = elems[0]
-        if len(elems) > 1:
-            end = elems[1]
+        end = elems[1] if len(elems) > 1 else SQLOperators.eq
 
-        column = getattr(model_db, begin, None)
-        if not column:
-            HTTPException(
+        column = _col(model_db, begin)
+        if column is None:
+            raise HTTPException(
                 status_code=400,
-                detail=f"No column {column} in {model_db.__name__} table model",
+                detail=f"No column {begin} in {model_db.__name__} table model",
             )
-        if end == SQLOperators.eq:
-            condition = column == v
-            statement = statement.filter(condition)
-        elif end == SQLOperators.ilike:
-            condition = column.ilike(v)  # type: ignore
-            statement = statement.filter(condition)
-            pass
-        elif end == SQLOperators._in:
-            condition = column.in_(v)  # type: ignore
-            statement = statement.filter(condition)
-        elif end == SQLOperators.gte:
-            condition = column >= v
-            statement = statement.filter(condition)
-        elif end == SQLOperators.lte:
-            condition = column <= v
-            statement = statement.filter(condition)
-        elif end == SQLOperators.gt:
-            condition = column > v
-            statement = statement.filter(condition)
-        elif end == SQLOperators.lt:
-            condition = column < v
-            statement = statement.filter(condition)
-        else:
+        condition_builder = _OP_DISPATCH.get(end)
+        if condition_builder is None:
             raise HTTPException(status_code=422, detail="Unsupported SQL operator")
+        conditions.append(condition_builder(column, v))
 
-    return statement
+    if conditions:
+        return FilteredStatement(
+            statement=statement.where(*conditions), has_user_filters=True
+        )
+    return FilteredStatement(statement=statement, has_user_filters=False)
 
 
 def set_sorting(statement: SelectOfScalar, model_db: SuperBase, sort: str | None):
 
-    if sort == None:
+    if sort is None or not sort.strip():
+        return statement
+    sort_columns, sort_orders = parse_sort_string(sort)
+    if not sort_columns:
         return statement
-    sort_columns, sort_orders = parse_sort_string(sort) if sort else ([], [])
     statement = apply_sorting(
-        stmt=statement,
+        statement=statement,
         model_db=model_db,
         sort_columns=sort_columns,
         sort_orders=sort_orders,
@@ -182,25 +202,105 @@ def set_sorting(statement: SelectOfScalar, model_db: SuperBase, sort: str | None
     return statement
 
 
+# Диалекты с оконными функциями: count(*) считается в том же запросе
+_WINDOW_DIALECTS = {"postgresql", "sqlite", "mysql", "mariadb", "mssql", "oracle"}
+
+# TTL кэша количества строк для запросов без пользовательских фильтров
+_COUNT_CACHE_TTL = 30  # секунд
+
+
+@lru_cache(maxsize=64)
+def _count_by_status(engine, model_db, status: Status, _time_bucket: int) -> int:
+    """Количество строк модели по статусу; _time_bucket — только ключ кэша (TTL)"""
+    with Session(engine) as count_session:
+        return (
+            count_session.scalar(
+                select(func.count())
+                .select_from(model_db)
+                .where(model_db.status_id == status)
+            )
+            or 0
+        )
+
+
 def set_offset_limit(
     session: Session,
     pagination: PaginationParams,
     model_db: SuperBase,
     statement,
+    has_user_filters: bool = True,
+    status: Status | None = None,
 ):
-    count_statement = select(func.count()).select_from(statement)
-    total = session.exec(count_statement).one()
-
-    pages = (total + pagination.per_page - 1) // pagination.per_page
+    per_page = pagination.per_page
+    offset = (pagination.page - 1) * per_page
+
+    if not has_user_filters and status is not None:
+        # Без пользовательских фильтров точный count повторяется от запроса
+        # к запросу — берём его из кэша с коротким TTL
+        total = _count_by_status(
+            session.get_bind(),
+            model_db,
+            status,
+            int(time.time() // _COUNT_CACHE_TTL),
+        )
+        if total == 0:
+            # Пустая выборка: страница-запрос не нужен вовсе
+            return PaginatedResponse.model_construct(
+                data=[],
+                page=pagination.page,
+                per_page=per_page,
+                total_records=0,
+                pages=0,
+            )
+        result = (
+            session.execute(statement.offset(offset).limit(per_page)).scalars().all()
+        )
+    elif session.get_bind().dialect.name in _WINDOW_DIALECTS:
+        # Один запрос вместо двух: total приходит оконной функцией в каждой строке
+        windowed = (
+            statement.add_columns(func.count().over().label("__total"))
+            .offset(offset)
+            .limit(per_page)
+        )
+        # session.execute, а не exec: exec() применяет .scalars() к
+        # SelectOfScalar и молча выбрасывает оконную колонку __total
+        rows = session.execute(windowed).all()
+        if rows:
+            total = rows[0][-1]
+            result = [row[0] for row in rows]
+        else:
+            result = []
+            # Страница за пределами выборки: total нужно посчитать отдельно
+            total = (
+                session.scalar(
+                    select(func.count()).select_from(statement.subquery())
+                )
+                or 0
+                if offset
+                else 0
+            )
+    else:
+        # .subquery() даёт корректный count при ORDER BY, scalar()/scalars()
+        # обходят обёртку Row на каждую строку
+        count_statement = select(func.count()).select_from(statement.subquery())
+        total = session.scalar(count_statement) or 0
+        if total == 0:
+            result = []
+        else:
+            result = (
+                session.execute(statement.offset(offset).limit(per_page))
+                .scalars()
+                .all()
+            )
 
-    offset = (pagination.page - 1) * pagination.per_page
+    pages = (total + per_page - 1) // per_page
 
-    statement = statement.offset(offset).limit(pagination.per_page)
-    result = session.exec(statement).all()
-    return PaginatedResponse(
+    # model_construct: строки уже валидированы SQLModel, а response_model
+    # эндпоинта делает свой проход валидации — второй здесь не нужен
+    return PaginatedResponse.model_construct(
         data=result,
         page=pagination.page,
-        per_page=pagination.per_page,
+        per_page=per_page,
         total_records=total,
         pages=pages,
     )
@@ -5,7 +5,16 @@ from fastapi import APIRouter, HTTPException
 from sqlmodel import func, select
 
 from app.api.deps import CurrentUser, SessionDep
-from app.models import Item, ItemCreate, ItemPublic, ItemsPublic, ItemUpdate, Message
+from app.models import (
+    Item,
+    ItemCreate,
+    ItemPublic,
+    ItemsPublic,
+    ItemUpdate,
+    Message,
+    dump_items,
+    msg,
+)
 
 router = APIRouter(prefix="/items", tags=["items"])
 
@@ -38,7 +47,7 @@ def read_items(
         )
         items = session.exec(statement).all()
 
-    return ItemsPublic(data=items, count=count)
+    return dump_items(items, count=count)
 
 
 @router.get("/{id}", response_model=ItemPublic)
@@ -106,4 +115,4 @@ def delete_item(
         raise HTTPException(status_code=400, detail="Not enough permissions")
     session.delete(item)
     session.commit()
-    return Message(message="Item deleted successfully")
+    return msg("Item deleted successfully")
@@ -23,6 +23,8 @@ from app.models import (
     UsersPublic,
     UserUpdate,
     UserUpdateMe,
+    dump_users,
+    msg,
 )
 from app.utils import generate_new_account_email, send_email
 
@@ -45,7 +47,7 @@ def read_users(session: SessionDep, skip: int = 0, limit: int = 100) -> Any:
     statement = select(User).offset(skip).limit(limit)
     users = session.exec(statement).all()
 
-    return UsersPublic(data=users, count=count)
+    return dump_users(users, count=count)
 
 
 @router.post(
@@ -114,7 +116,7 @@ def update_password_me(
     current_user.hashed_password = hashed_password
     session.add(current_user)
     session.commit()
-    return Message(message="Password updated successfully")
+    return msg("Password updated successfully")
 
 
 @router.get("/me", response_model=UserPublic)
@@ -136,7 +138,7 @@ def delete_user_me(session: SessionDep, current_user: CurrentUser) -> Any:
         )
     session.delete(current_user)
     session.commit()
-    return Message(message="User deleted successfully")
+    return msg("User deleted successfully")
 
 
 @router.post("/signup", response_model=UserPublic)
@@ -223,4 +225,4 @@ def delete_user(
     session.exec(statement)  # type: ignore
     session.delete(user)
     session.commit()
-    return Message(message="User deleted successfully")
+    return msg("User deleted successfully")
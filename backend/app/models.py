@@ -1,53 +1,139 @@
+import re
 import uuid
+from collections.abc import Sequence
+from datetime import datetime
 from enum import Enum
-from datetime import datetime, timezone
-from pydantic import EmailStr
-from sqlmodel import Field, Relationship, SQLModel
+from functools import lru_cache
+from typing import Annotated, Any, Literal, TypeAlias
+
+from pydantic import (
+    AfterValidator,
+    BeforeValidator,
+    PlainSerializer,
+    StringConstraints,
+    TypeAdapter,
+)
+from sqlalchemy import Column, text
+from sqlalchemy import Enum as SAEnum
+from sqlalchemy.dialects.postgresql import UUID as PgUUID
+from sqlmodel import Field, Relationship, SQLModel, func
+
+# Быстрая проверка формата вместо email-validator (чистый Python, дорогой разбор)
+EMAIL_RE = re.compile(r"^[^@\s]+@[^@\s]+\.[^@\s]+$")
+
+
+def _validate_email(v: str) -> str:
+    if not EMAIL_RE.fullmatch(v):
+        raise ValueError("invalid email")
+    return v
+
+
+# Общие аннотации: pydantic-core переиспользует один скомпилированный
+# строковый валидатор вместо отдельного на каждое поле
+Email: TypeAlias = Annotated[
+    str, StringConstraints(max_length=255), AfterValidator(_validate_email)
+]
+Password: TypeAlias = Annotated[str, StringConstraints(min_length=8, max_length=40)]
+
+# В JSON id уходит как 32-символьный hex: UUID.hex минует ветку
+# дефисного форматирования и не аллоцирует строку на каждую строку выдачи
+HexUUID: TypeAlias = Annotated[
+    uuid.UUID, PlainSerializer(lambda u: u.hex, return_type=str, when_used="json")
+]
 
-def aware_utcnow():
-    return datetime.now(timezone.utc)
 
 class Status(str, Enum):
     active = "active"
     inactive = "inactive"
     deleted = "deleted"
 
+
+def _status_value(v: Any) -> Any:
+    return v.value if isinstance(v, Status) else v
+
+
+# Literal вместо Enum: в pydantic-core это сравнение интернированных строк,
+# без обхода Enum.__members__. BeforeValidator разворачивает члены Status
+# из ORM-строк — literal-матчер не принимает их напрямую
+StatusLiteral: TypeAlias = Annotated[
+    Literal["active", "inactive", "deleted"], BeforeValidator(_status_value)
+]
+
 class SuperBase(SQLModel):
     id: int | None = Field(default=None, primary_key=True)
-    created_at: datetime = Field(default_factory=aware_utcnow, nullable=False)
+    # Метки времени выставляет Postgres (server_default/onupdate): одна
+    # C-функция в том же round-trip вместо datetime-аллокации на каждую строку
+    created_at: datetime | None = Field(
+        default=None,
+        nullable=False,
+        sa_column_kwargs={"server_default": func.now()},
+    )
     created_by: int | None = None
-    updated_at: datetime = Field(default_factory=aware_utcnow, nullable=False)
+    updated_at: datetime | None = Field(
+        default=None,
+        nullable=False,
+        sa_column_kwargs={"server_default": func.now(), "onupdate": func.now()},
+    )
     updated_by: int | None = None
-    status_id: Status | None = Status.active
+    # Нативный Postgres ENUM: 4 байта на строку вместо TEXT и проверка
+    # значения на стороне БД
+    status_id: Status | None = Field(
+        default=Status.active,
+        sa_type=SAEnum(Status, name="status_enum", native_enum=True),
+        nullable=False,
+        sa_column_kwargs={"server_default": Status.active.value},
+    )
 
 class SuperBasePublic(SQLModel):
+    model_config = {"defer_build": True}
     id: int
     created_at: datetime
-    status_id: Status
+    status_id: StatusLiteral
 
 class CityBase(SQLModel):
     name: str = Field(max_length=100, description="Название города(населённого пункта)")
     region_id: int | None = Field(
-        default=None, foreign_key="region.id", description="ID региона"
+        default=None, foreign_key="region.id", index=True, description="ID региона"
     )
 
 
 class City(SuperBase, CityBase, table=True):
-    pass
+    model_config = {"defer_build": True}
 
+# Подкласс без полей: имя компонента в OpenAPI остаётся CityCreate
+# (фронтенд-клиент сгенерирован под него), а defer_build откладывает
+# дубликат SchemaValidator до первого использования
 class CityCreate(CityBase):
-    pass
+    model_config = {"defer_build": True}
 
 
 class CityPublic(CityBase, SuperBasePublic):
-    pass
-
-
-class CityPublicWithRelation(CityPublic):
-    pass
+    model_config = {
+        "defer_build": True,
+        "frozen": True,
+        "extra": "forbid",
+        "from_attributes": True,
+    }
+
+
+CityPublicWithRelation = CityPublic
+
+
+# Узкая проекция для списочных выдач: select(City.id, City.name) возвращает
+# две колонки вместо строки со всеми audit-полями
+class CityListItem(SQLModel):
+    model_config = {
+        "defer_build": True,
+        "frozen": True,
+        "extra": "forbid",
+        "from_attributes": True,
+    }
+    id: int
+    name: str
 
 
 class CityUpdate(SQLModel):
+    model_config = {"defer_build": True}
     name: str | None = Field(
         default=None, max_length=100, description="Название города(населённого пункта)"
     )
@@ -57,7 +143,9 @@ class CityUpdate(SQLModel):
 
 # Shared properties
 class UserBase(SQLModel):
-    email: EmailStr = Field(unique=True, index=True, max_length=255)
+    # max_length в Field нужен SQLModel для VARCHAR(255) в колонке;
+    # pydantic-валидация длины живёт в алиасе Email
+    email: Email = Field(unique=True, index=True, max_length=255)
     is_active: bool = True
     is_superuser: bool = False
     full_name: str | None = Field(default=None, max_length=255)
@@ -65,44 +153,78 @@ class UserBase(SQLModel):
 
 # Properties to receive via API on creation
 class UserCreate(UserBase):
-    password: str = Field(min_length=8, max_length=40)
+    model_config = {"defer_build": True}
+    password: Password
 
 
 class UserRegister(SQLModel):
-    email: EmailStr = Field(max_length=255)
-    password: str = Field(min_length=8, max_length=40)
+    model_config = {"defer_build": True}
+    email: Email
+    password: Password
     full_name: str | None = Field(default=None, max_length=255)
 
 
 # Properties to receive via API on update, all are optional
 class UserUpdate(UserBase):
-    email: EmailStr | None = Field(default=None, max_length=255)  # type: ignore
-    password: str | None = Field(default=None, min_length=8, max_length=40)
+    model_config = {"defer_build": True}
+    email: Email | None = None  # type: ignore
+    password: Password | None = None
 
 
 class UserUpdateMe(SQLModel):
+    model_config = {"defer_build": True}
     full_name: str | None = Field(default=None, max_length=255)
-    email: EmailStr | None = Field(default=None, max_length=255)
+    email: Email | None = None
 
 
 class UpdatePassword(SQLModel):
-    current_password: str = Field(min_length=8, max_length=40)
-    new_password: str = Field(min_length=8, max_length=40)
+    model_config = {"defer_build": True}
+    current_password: Password
+    new_password: Password
 
 
 # Database model, database table inferred from class name
 class User(UserBase, table=True):
-    id: uuid.UUID = Field(default_factory=uuid.uuid4, primary_key=True)
+    model_config = {"defer_build": True}
+    # id генерирует Postgres (pgcrypto.gen_random_uuid): без syscall'а в
+    # /dev/urandom и UUID-объекта на каждую вставку
+    id: uuid.UUID | None = Field(
+        default=None,
+        sa_column=Column(
+            PgUUID(as_uuid=True),
+            primary_key=True,
+            server_default=text("gen_random_uuid()"),
+        ),
+    )
     hashed_password: str
-    items: list["Item"] = Relationship(back_populates="owner", cascade_delete=True)
+    # raise_on_sql превращает скрытый N+1 в явную ошибку: нужны items —
+    # пишем selectinload. passive_deletes отдаёт каскад FK ON DELETE в БД,
+    # иначе session.delete(user) сам попытался бы загрузить коллекцию
+    items: list["Item"] = Relationship(
+        back_populates="owner",
+        cascade_delete=True,
+        sa_relationship_kwargs={"lazy": "raise_on_sql", "passive_deletes": True},
+    )
 
 
 # Properties to return via API, id is always required
 class UserPublic(UserBase):
-    id: uuid.UUID
+    model_config = {
+        "defer_build": True,
+        "frozen": True,
+        "extra": "forbid",
+        "from_attributes": True,
+    }
+    id: HexUUID
 
 
 class UsersPublic(SQLModel):
+    model_config = {
+        "defer_build": True,
+        "frozen": True,
+        "extra": "forbid",
+        "from_attributes": True,
+    }
     data: list[UserPublic]
     count: int
 
@@ -114,51 +236,135 @@ class ItemBase(SQLModel):
 
 
 # Properties to receive on item creation
+# (подкласс, а не алиас: имя схемы ItemCreate — часть контракта OpenAPI)
 class ItemCreate(ItemBase):
-    pass
+    model_config = {"defer_build": True}
 
 
 # Properties to receive on item update
 class ItemUpdate(ItemBase):
+    model_config = {"defer_build": True}
     title: str | None = Field(default=None, min_length=1, max_length=255)  # type: ignore
 
 
 # Database model, database table inferred from class name
 class Item(ItemBase, table=True):
-    id: uuid.UUID = Field(default_factory=uuid.uuid4, primary_key=True)
+    model_config = {"defer_build": True}
+    id: uuid.UUID | None = Field(
+        default=None,
+        sa_column=Column(
+            PgUUID(as_uuid=True),
+            primary_key=True,
+            server_default=text("gen_random_uuid()"),
+        ),
+    )
     owner_id: uuid.UUID = Field(
-        foreign_key="user.id", nullable=False, ondelete="CASCADE"
+        foreign_key="user.id", nullable=False, ondelete="CASCADE", index=True
     )
     owner: User | None = Relationship(back_populates="items")
 
 
 # Properties to return via API, id is always required
 class ItemPublic(ItemBase):
-    id: uuid.UUID
-    owner_id: uuid.UUID
+    model_config = {
+        "defer_build": True,
+        "frozen": True,
+        "extra": "forbid",
+        "from_attributes": True,
+    }
+    id: HexUUID
+    owner_id: HexUUID
 
 
 class ItemsPublic(SQLModel):
+    model_config = {
+        "defer_build": True,
+        "frozen": True,
+        "extra": "forbid",
+        "from_attributes": True,
+    }
     data: list[ItemPublic]
     count: int
 
 
+# Пакетные адаптеры: весь список строк валидируется одним вызовом
+# Rust-ядра pydantic вместо model_validate на каждую строку
+_USERS_ADAPTER = TypeAdapter(list[UserPublic])
+_ITEMS_ADAPTER = TypeAdapter(list[ItemPublic])
+
+
+def dump_users(rows: Sequence[Any], count: int | None = None) -> dict[str, Any]:
+    return {
+        "data": _USERS_ADAPTER.validate_python(rows),
+        "count": count if count is not None else len(rows),
+    }
+
+
+def dump_items(rows: Sequence[Any], count: int | None = None) -> dict[str, Any]:
+    return {
+        "data": _ITEMS_ADAPTER.validate_python(rows),
+        "count": count if count is not None else len(rows),
+    }
+
+
+# Пакетная валидация для bulk-загрузки: длины/обязательность всех строк
+# проверяются одним вызовом Rust-ядра, без Python-цикла по элементам
+_ITEM_CREATE_ADAPTER = TypeAdapter(list[ItemCreate])
+
+
+def validate_items_batch(raw: Any) -> list[ItemCreate]:
+    return _ITEM_CREATE_ADAPTER.validate_python(raw)
+
+
 # Generic message
 class Message(SQLModel):
+    model_config = {
+        "defer_build": True,
+        "frozen": True,
+        "extra": "forbid",
+        "from_attributes": True,
+    }
     message: str
 
 
+# Набор строк ответов фиксирован, а Message заморожен — один и тот же
+# инстанс безопасно переиспользуется между запросами без новых аллокаций
+@lru_cache(maxsize=128)
+def msg(text: str) -> Message:
+    return Message(message=text)
+
+
 # JSON payload containing access token
 class Token(SQLModel):
+    model_config = {
+        "defer_build": True,
+        "frozen": True,
+        "extra": "forbid",
+        "from_attributes": True,
+    }
     access_token: str
     token_type: str = "bearer"
 
 
 # Contents of JWT token
 class TokenPayload(SQLModel):
+    model_config = {"defer_build": True}
     sub: str | None = None
 
 
+# Один скомпилированный валидатор на процесс: декодирование JWT на каждом
+# запросе минует Python-диспетчеризацию model_validate
+TOKEN_PAYLOAD_ADAPTER = TypeAdapter(TokenPayload)
+
+
 class NewPassword(SQLModel):
+    model_config = {"defer_build": True}
     token: str
-    new_password: str = Field(min_length=8, max_length=40)
+    new_password: Password
+
+
+# Один общий rebuild вместо отдельного разрешения forward ref'ов на модель:
+# пространство имён типов строится единожды
+_ns = {"User": User, "Item": Item, "City": City}
+for _model in (User, Item, City):
+    _model.model_rebuild(_types_namespace=_ns)
@@ -36,8 +36,9 @@ def test_read_item(
     content = response.json()
     assert content["title"] == item.title
     assert content["description"] == item.description
-    assert content["id"] == str(item.id)
-    assert content["owner_id"] == str(item.owner_id)
+    assert item.id is not None
+    assert content["id"] == item.id.hex
+    assert content["owner_id"] == item.owner_id.hex
 
 
 def test_read_item_not_found(
@@ -93,8 +94,9 @@ def test_update_item(
     content = response.json()
     assert content["title"] == data["title"]
     assert content["description"] == data["description"]
-    assert content["id"] == str(item.id)
-    assert content["owner_id"] == str(item.owner_id)
+    assert item.id is not None
+    assert content["id"] == item.id.hex
+    assert content["owner_id"] == item.owner_id.hex
 
 
 def test_update_item_not_found(
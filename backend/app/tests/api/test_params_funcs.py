@@ -0,0 +1,71 @@
+from collections.abc import Generator
+
+import pytest
+from sqlalchemy import Column, Integer, Table
+from sqlmodel import Session, SQLModel, create_engine, select
+
+from app.api.endpoint_generator.api_models import PaginationParams
+from app.api.endpoint_generator.params_funcs import (
+    set_filters,
+    set_offset_limit,
+    set_status,
+)
+from app.models import City, Status
+
+
+@pytest.fixture
+def sqlite_session() -> Generator[Session, None, None]:
+    engine = create_engine("sqlite://")
+    # city.region_id ссылается на region, модели которого в репозитории нет —
+    # без таблицы-заглушки create_all падает с NoReferencedTableError
+    if "region" not in SQLModel.metadata.tables:
+        Table("region", SQLModel.metadata, Column("id", Integer, primary_key=True))
+    SQLModel.metadata.create_all(
+        engine, tables=[SQLModel.metadata.tables["region"], City.__table__]
+    )
+    with Session(engine) as session:
+        for i in range(5):
+            session.add(City(name=f"city-{i}"))
+        session.commit()
+        yield session
+
+
+def test_set_offset_limit_windowed_count(sqlite_session: Session) -> None:
+    filtered = set_filters(select(City), City, {"name__ilike": "%city%"})
+    response = set_offset_limit(
+        sqlite_session,
+        PaginationParams(page=1, per_page=3),
+        City,
+        filtered.statement,
+        has_user_filters=filtered.has_user_filters,
+    )
+    assert response.total_records == 5
+    assert response.pages == 2
+    assert [city.name for city in response.data] == ["city-0", "city-1", "city-2"]
+
+
+def test_set_offset_limit_page_past_end(sqlite_session: Session) -> None:
+    filtered = set_filters(select(City), City, {"name__ilike": "%city%"})
+    response = set_offset_limit(
+        sqlite_session,
+        PaginationParams(page=3, per_page=3),
+        City,
+        filtered.statement,
+        has_user_filters=filtered.has_user_filters,
+    )
+    assert response.data == []
+    assert response.total_records == 5
+
+
+def test_set_offset_limit_cached_status_count(sqlite_session: Session) -> None:
+    statement = set_status(select(City), City, Status.active)
+    response = set_offset_limit(
+        sqlite_session,
+        PaginationParams(page=1, per_page=10),
+        City,
+        statement,
+        has_user_filters=False,
+        status=Status.active,
+    )
+    assert response.total_records == 5
+    assert len(response.data) == 5
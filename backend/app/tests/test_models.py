@@ -0,0 +1,20 @@
+from datetime import datetime
+
+from app.models import City, CityPublic, Status
+
+
+def test_city_public_accepts_status_enum_member() -> None:
+    row = City(id=1, name="name", created_at=datetime.now(), status_id=Status.active)
+    public = CityPublic.model_validate(row)
+    assert public.status_id == "active"
+
+
+def test_city_public_rejects_unknown_status() -> None:
+    row = City(id=1, name="name", created_at=datetime.now())
+    row.status_id = "archived"  # type: ignore[assignment]
+    try:
+        CityPublic.model_validate(row)
+    except ValueError:
+        pass
+    else:
+        raise AssertionError("unknown status value passed validation")